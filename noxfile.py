@@ -6,3 +6,12 @@ def tests(session):
     session.install(".")
     session.install("pytest")
     session.run("pytest", "tests")
+
+
+@nox.session
+def tests_compiled(session):
+    session.install("cython")
+    session.install("-e", ".")
+    session.install("pytest")
+    session.run("cythonize", "-i", "src/predicates/_ccomposite.pyx")
+    session.run("pytest", "tests")
@@ -1,6 +1,12 @@
+import operator
 import typing as t
-from functools import wraps
+from functools import lru_cache, reduce, wraps
+from itertools import compress, filterfalse, islice
 
+try:
+    from predicates import _ccomposite
+except ImportError:  # the optional Cython extension has not been built
+    _ccomposite = None
 
 TruthFinder = t.Callable[[t.Any], bool]
 
@@ -15,6 +21,189 @@ def always_false(_):
     return False
 
 
+def _flattened(cls: type, *rules: TruthFinder) -> t.Iterator[TruthFinder]:
+    """Yields the given rules, splicing in the rules of any `cls` instances.
+
+    Used to build flat composites from chained operators, so that
+    `a & b & c` evaluates as one intersection of three rules rather than
+    an intersection nested inside another.
+    """
+    for rule in rules:
+        if type(rule) is cls:
+            yield from rule.rules
+        else:
+            yield rule
+
+
+def _unwrapped(rule: TruthFinder) -> TruthFinder:
+    """Returns the rule of a plain Predicate, or any other rule unchanged.
+
+    Calling a plain Predicate only forwards to its rule, so composites hold
+    the rule itself and skip a layer of calls. Predicate subclasses carry
+    their own logic and are kept as they are.
+    """
+    if type(rule) is Predicate:
+        return rule.rule
+    return rule
+
+
+def _simplified(
+    rules: t.Iterable[TruthFinder], neutral: TruthFinder, dominant: TruthFinder
+) -> t.Tuple[TruthFinder, ...]:
+    """Removes constant rules that cannot change a composite's outcome.
+
+    `neutral` rules are dropped entirely, and a single `dominant` rule
+    decides the result on its own (e.g. for an intersection, `always_true`
+    is neutral and `always_false` is dominant).
+    """
+    rules = tuple(rules)
+    if any(rule is dominant for rule in rules):
+        return (dominant,)
+    return tuple(rule for rule in rules if rule is not neutral) or (neutral,)
+
+
+_MAX_FUSED_RULES = 8
+
+
+def _fused_chain(rules: t.Tuple[TruthFinder, ...], joiner: str) -> TruthFinder:
+    """Builds one function that evaluates `rules` joined by `and` or `or`.
+
+    For short chains, a lambda such as
+
+        lambda item, r0=rules[0], r1=rules[1]: True if r0(item) and r1(item) else False
+
+    is generated and evaluated, so each rule is a fast local and the
+    interpreter's own short-circuiting replaces a Python loop. Longer chains
+    fall back to an equivalent loop, compiled if the optional `_ccomposite`
+    extension has been built.
+    """
+    if len(rules) <= _MAX_FUSED_RULES:
+        defaults = ", ".join(f"r{i}=rules[{i}]" for i in range(len(rules)))
+        calls = f" {joiner} ".join(f"r{i}(item)" for i in range(len(rules)))
+        source = f"lambda item, {defaults}: True if {calls} else False"
+        return eval(source, {"rules": rules})
+
+    if _ccomposite is not None:
+        if joiner == "and":
+            return _ccomposite.AllOf(rules)
+        return _ccomposite.AnyOf(rules)
+
+    # a plain loop is measurably faster here than pushing the iteration into
+    # C with `all(map(methodcaller("__call__", item), rules))`, since that
+    # builds a methodcaller and a map object on every call
+    if joiner == "and":
+
+        def passes(item):
+            for rule in rules:
+                if not rule(item):
+                    return False
+            return True
+
+    else:
+
+        def passes(item):
+            for rule in rules:
+                if rule(item):
+                    return True
+            return False
+
+    return passes
+
+
+def _memoized(rule: TruthFinder) -> TruthFinder:
+    """Wraps a rule with an unbounded cache of its results.
+
+    Hashable items are cached by type and value, so that equal items of
+    different types (such as `1`, `1.0` and `True`) are kept apart.
+    Unhashable items are cached by identity; each is stored alongside its
+    result so that its id cannot be reused by another object while the
+    cache is alive.
+    """
+    by_value = {}
+    by_identity = {}
+
+    def cached_rule(item):
+        key = (type(item), item)
+        try:
+            return by_value[key]
+        except KeyError:
+            cache = by_value
+        except TypeError:
+            key = id(item)
+            try:
+                return by_identity[key][1]
+            except KeyError:
+                cache = by_identity
+        # evaluated outside the handlers above, so that errors raised by the
+        # rule are not chained onto the cache miss
+        result = rule(item)
+        cache[key] = result if cache is by_value else (item, result)
+        return result
+
+    return cached_rule
+
+
+def _rule_mask(rule: TruthFinder, array: t.Any) -> t.Any:
+    """Evaluates a rule over a whole NumPy array as a boolean mask.
+
+    Predicates build their mask from their own rules, except for subclasses
+    with logic of their own, which are called once per element. Any other
+    callable is applied to the array directly. Scalar results, such as those
+    returned by `always_true`, are broadcast to the length of the array.
+    """
+    import numpy as np
+
+    if isinstance(rule, Predicate):
+        if _has_own_logic(rule):
+            return np.fromiter(map(rule, array), dtype=bool, count=len(array))
+        return rule._array_mask(array)
+
+    mask = np.asarray(rule(array), dtype=bool)
+    if mask.ndim == 0:
+        mask = np.full(len(array), mask)
+    return mask
+
+
+def _jit_compiled(rule: TruthFinder, njit: t.Callable) -> t.Callable:
+    """Compiles a rule with Numba, fusing Predicates into a single function."""
+    if isinstance(rule, Predicate):
+        if _has_own_logic(rule):
+            raise TypeError(
+                f"{type(rule).__name__} overrides how items are evaluated "
+                "and cannot be compiled with Numba"
+            )
+        return rule._jit_rule(njit)
+    return njit(rule)
+
+
+def _jit_fused(expression: str, rules: t.Sequence, njit: t.Callable) -> t.Callable:
+    """Compiles `expression`, written in terms of `item` and rules `r0`..`rN`.
+
+    Each rule is compiled first and made visible to the generated function as
+    a global, so Numba can inline the whole chain into one native function.
+    """
+    namespace = {f"r{i}": _jit_compiled(rule, njit) for i, rule in enumerate(rules)}
+    exec(f"def fused(item):\n    return {expression}\n", namespace)
+    return njit(namespace["fused"])
+
+
+def _inlined_source(rule: TruthFinder, namespace: t.Dict[str, t.Any]) -> str:
+    """Returns a Python expression that evaluates `rule` for `item`.
+
+    Built-in Predicates are expanded into the expression of their rules.
+    Any other callable, including Predicate subclasses with logic of their
+    own, is stored in `namespace` under a generated name and called by it.
+    """
+    if type(rule) in _INLINED_TYPES:
+        return rule._source(namespace)
+    for name, value in namespace.items():
+        if value is rule:
+            return f"{name}(item)"
+    name = f"r{len(namespace)}"
+    namespace[name] = rule
+    return f"{name}(item)"
+
+
 class Predicate:
     """Callable object that evaluates a boolean based on a callable rule.
 
@@ -26,13 +215,30 @@ class Predicate:
             value, given exactly one argument.
     """
 
+    __slots__ = ("rule", "__weakref__")
+
     def __init__(self, rule: TruthFinder):
         self.rule = rule
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # calling a Predicate runs item_passes directly, without an extra
+        # frame. Keep that true for subclasses that end up with a different
+        # item_passes (defined here or by a mixin), but only while the
+        # inherited __call__ is such an alias rather than a custom __call__
+        owner = next(base for base in cls.__mro__ if "__call__" in vars(base))
+        if owner is cls:
+            return
+        inherited_is_alias = vars(owner)["__call__"] is vars(owner).get("item_passes")
+        if inherited_is_alias and cls.item_passes is not cls.__call__:
+            cls.__call__ = cls.item_passes
+
     def item_passes(self, item: t.Any) -> bool:
         """The given item passes the Predicate's rule."""
         return self.rule(item)
 
+    __call__ = item_passes
+
     def filtered(self, iterable: t.Iterable) -> t.Iterator:
         """Returns a an iterator of items for which the Predicate is valid
 
@@ -40,22 +246,153 @@ class Predicate:
             iterable: any iterable of items that are able to be evaluated
                 by the Predicate's rule
         """
+        if type(iterable) is filter:
+            # fuse with the filter we are wrapping, so each item is checked
+            # by a single intersection instead of passing through two filters
+            _, (inner_rule, inner_iterator) = iterable.__reduce__()
+            if inner_rule is not None:
+                rules = _flattened(PredicateIntersection, inner_rule, self)
+                return filter(PredicateIntersection(*rules), inner_iterator)
         return filter(self, iterable)
 
-    def __call__(self, item: t.Any) -> bool:
-        return self.item_passes(item)
+    def filtered_adaptive(self, iterable: t.Iterable, warmup: int = 1024) -> t.Iterator:
+        """Like `filtered`, but lets compound Predicates tune their rule order.
+
+        Compound Predicates observe how often each of their rules passes over
+        the first `warmup` items, then reorder their rules for the remaining
+        items so that short-circuiting skips as many rule calls as possible.
+        Only use this with rules that are free of side effects and safe to
+        call on every item in any order; a guard such as `is_integer` in
+        `is_integer & is_even` may end up running after the rule it guards.
+
+        Args:
+            iterable: any iterable of items that are able to be evaluated
+                by the Predicate's rule
+            warmup: the number of items to observe before reordering
+        """
+        return self.filtered(iterable)
+
+    def filtered_batch(self, iterable: t.Iterable, batch: int = 4096) -> t.Iterator:
+        """Like `filtered`, but evaluates the Predicate over batches of items.
+
+        Items are gathered into lists of up to `batch` items, and each list
+        is filtered with `itertools.compress`, so the selection loop runs in C
+        rather than in a Python-level iterator.
+
+        Args:
+            iterable: any iterable of items that are able to be evaluated
+                by the Predicate's rule
+            batch: the maximum number of items to evaluate at once
+
+        Raises:
+            ValueError: if `batch` is less than 1
+        """
+        if batch < 1:
+            raise ValueError(f"batch must be at least 1, not {batch}")
+        return _batch_filtered_items(self, iterable, batch)
+
+    def _batch_filtered(self, chunk: t.List) -> t.Iterable:
+        return compress(chunk, map(self, chunk))
+
+    def filtered_array(self, array: t.Any) -> t.Any:
+        """Returns the elements of an array for which the Predicate is valid
+
+        Unlike `filtered`, rules are called once with the whole array rather
+        than once per element, so every rule must be written in terms of
+        vectorized operations (`lambda x: x % 2 == 0` works, `math.isnan`
+        does not). Subclasses that override `item_passes` are still called
+        once per element. Requires NumPy.
+
+        Args:
+            array: a one-dimensional NumPy array, or anything that can be
+                converted to one
+        """
+        import numpy as np
+
+        array = np.asarray(array)
+        return array[_rule_mask(self, array)]
+
+    def _array_mask(self, array: t.Any) -> t.Any:
+        return _rule_mask(self.rule, array)
+
+    def jit(self) -> "Predicate":
+        """Returns a copy of the Predicate compiled to native code with Numba.
+
+        Compound Predicates are fused into a single compiled function, so an
+        item is checked without any Python-level calls. Every rule must be
+        something Numba can compile in nopython mode, such as simple numeric
+        functions. Compilation happens on the first call. If Numba is not
+        installed, the Predicate itself is returned.
+
+        Raises:
+            TypeError: if this Predicate, or any Predicate it is built from,
+                is of a subclass that overrides `item_passes`
+        """
+        try:
+            from numba import njit
+        except ImportError:
+            return self
+        return Predicate(_jit_compiled(self, njit))
+
+    def _jit_rule(self, njit: t.Callable) -> t.Callable:
+        return _jit_compiled(self.rule, njit)
+
+    def compile(self) -> "Predicate":
+        """Returns a copy of the Predicate evaluated by a single function.
+
+        The whole tree of compound Predicates is translated into one Python
+        expression, such as `(a(item) and b(item)) or (not c(item))`, so an
+        item is checked without calling through each Predicate in the tree.
+        Trees too deeply nested for the Python parser are returned unchanged.
+        """
+        namespace = {}
+        try:
+            expression = _inlined_source(self, namespace)
+            defaults = "".join(f", {name}={name}" for name in namespace)
+            source = f"lambda item{defaults}: True if {expression} else False"
+            return Predicate(eval(source, namespace))
+        except (SyntaxError, RecursionError, MemoryError):
+            return self
+
+    def _source(self, namespace: t.Dict[str, t.Any]) -> str:
+        return _inlined_source(self.rule, namespace)
+
+    def memoized(self) -> "Predicate":
+        """Returns a Predicate that caches this Predicate's result per item.
+
+        Repeated evaluations of the same item are answered from the cache
+        rather than by re-running the rule. This is only safe for pure rules,
+        whose result depends on nothing but the item itself. The cache holds
+        a reference to every item it has seen and is never pruned.
+        """
+        return Predicate(_memoized(self))
 
     def __and__(self, other: TruthFinder) -> "PredicateIntersection":
-        return PredicateIntersection(self, other)
+        return PredicateIntersection(*_flattened(PredicateIntersection, self, other))
+
+    def __rand__(self, other: TruthFinder) -> "PredicateIntersection":
+        if not callable(other):
+            return NotImplemented
+        return PredicateIntersection(*_flattened(PredicateIntersection, other, self))
 
     def __or__(self, other: TruthFinder) -> "PredicateUnion":
-        return PredicateUnion(self, other)
+        return PredicateUnion(*_flattened(PredicateUnion, self, other))
+
+    def __ror__(self, other: TruthFinder) -> "PredicateUnion":
+        if not callable(other):
+            return NotImplemented
+        return PredicateUnion(*_flattened(PredicateUnion, other, self))
 
     def __sub__(self, other: TruthFinder) -> "PredicateDifference":
         return PredicateDifference(self, other)
 
-    def __invert__(self) -> "PredicateDifference":
-        return PredicateDifference(always_true, self)
+    def __invert__(self) -> "Predicate":
+        if type(self) is Predicate:
+            if self.rule is always_true:
+                return Predicate(always_false)
+            if self.rule is always_false:
+                return Predicate(always_true)
+        return NotPredicate(self)
 
     def __xor__(self, other) -> "ExclusivePredicateUnion":
         return ExclusivePredicateUnion(self, other)
@@ -64,32 +401,159 @@ class Predicate:
 class PredicateIntersection(Predicate):
     """Represents a set of rules which must ALL be True"""
 
+    __slots__ = ("_rules", "_fused")
+
     def __init__(self, *rules: TruthFinder):
         self.rules = rules
 
+    @property
+    def rules(self) -> t.Tuple[TruthFinder, ...]:
+        return self._rules
+
+    @rules.setter
+    def rules(self, rules: t.Iterable[TruthFinder]) -> None:
+        # the fused evaluator must be rebuilt whenever the rules change
+        rules = map(_unwrapped, rules)
+        self._rules = _simplified(rules, always_true, always_false)
+        self._fused = _fused_chain(self._rules, "and")
+
+    def __getstate__(self) -> t.Tuple[TruthFinder, ...]:
+        # the fused evaluator is generated code that cannot be pickled or
+        # copied; it is rebuilt from the rules instead
+        return self.rules
+
+    def __setstate__(self, rules: t.Tuple[TruthFinder, ...]) -> None:
+        self.rules = rules
+
     def item_passes(self, item: t.Any) -> bool:
-        return all(rule(item) for rule in self.rules)
+        return self._fused(item)
+
+    def _batch_filtered(self, chunk: t.List) -> t.Iterable:
+        # narrow the batch one rule at a time, so later rules only see
+        # the items that passed every earlier rule
+        for rule in self.rules:
+            chunk = list(compress(chunk, map(rule, chunk)))
+        return chunk
+
+    def _array_mask(self, array: t.Any) -> t.Any:
+        return reduce(operator.and_, (_rule_mask(r, array) for r in self.rules))
+
+    def _jit_rule(self, njit: t.Callable) -> t.Callable:
+        expression = " and ".join(f"r{i}(item)" for i in range(len(self.rules)))
+        return _jit_fused(expression, self.rules, njit)
+
+    def _source(self, namespace: t.Dict[str, t.Any]) -> str:
+        terms = (_inlined_source(rule, namespace) for rule in self.rules)
+        return f"({' and '.join(terms)})"
+
+    def filtered_adaptive(self, iterable: t.Iterable, warmup: int = 1024) -> t.Iterator:
+        # rules that fail most often run first
+        return _adaptive_filtered(self, iterable, warmup, stop_on=False)
 
 
 class PredicateUnion(Predicate):
     """Represents a set of rules where ANY rule must be True"""
 
+    __slots__ = ("_rules", "_fused")
+
     def __init__(self, *rules: TruthFinder):
         self.rules = rules
 
+    @property
+    def rules(self) -> t.Tuple[TruthFinder, ...]:
+        return self._rules
+
+    @rules.setter
+    def rules(self, rules: t.Iterable[TruthFinder]) -> None:
+        # the fused evaluator must be rebuilt whenever the rules change
+        rules = map(_unwrapped, rules)
+        self._rules = _simplified(rules, always_false, always_true)
+        self._fused = _fused_chain(self._rules, "or")
+
+    def __getstate__(self) -> t.Tuple[TruthFinder, ...]:
+        # the fused evaluator is generated code that cannot be pickled or
+        # copied; it is rebuilt from the rules instead
+        return self.rules
+
+    def __setstate__(self, rules: t.Tuple[TruthFinder, ...]) -> None:
+        self.rules = rules
+
     def item_passes(self, item):
-        return any(rule(item) for rule in self.rules)
+        return self._fused(item)
+
+    def _array_mask(self, array: t.Any) -> t.Any:
+        return reduce(operator.or_, (_rule_mask(r, array) for r in self.rules))
+
+    def _jit_rule(self, njit: t.Callable) -> t.Callable:
+        expression = " or ".join(f"r{i}(item)" for i in range(len(self.rules)))
+        return _jit_fused(expression, self.rules, njit)
+
+    def _source(self, namespace: t.Dict[str, t.Any]) -> str:
+        terms = (_inlined_source(rule, namespace) for rule in self.rules)
+        return f"({' or '.join(terms)})"
+
+    def filtered_adaptive(self, iterable: t.Iterable, warmup: int = 1024) -> t.Iterator:
+        # rules that pass most often run first
+        return _adaptive_filtered(self, iterable, warmup, stop_on=True)
 
 
 class ExclusivePredicateUnion(Predicate):
     """Represents a set of rules where ONLY ONE rule must be True"""
 
+    __slots__ = ("rules",)
+
     def __init__(self, *rules: TruthFinder):
-        self.rules = rules
+        self.rules = tuple(map(_unwrapped, rules))
 
     def item_passes(self, item):
-        # exploits the fact that booleans are ints
-        return sum(rule(item) for rule in self.rules) == 1
+        rules = self.rules
+        seen = False
+        for rule in rules:
+            if rule(item):
+                # a second passing rule means the item can never pass
+                if seen:
+                    return False
+                seen = True
+        return seen
+
+    def _array_mask(self, array: t.Any) -> t.Any:
+        # counts passing rules per element; xor would test parity instead
+        return sum(_rule_mask(rule, array) for rule in self.rules) == 1
+
+    def _jit_rule(self, njit: t.Callable) -> t.Callable:
+        terms = " + ".join(f"int(r{i}(item))" for i in range(len(self.rules)))
+        return _jit_fused(f"({terms}) == 1", self.rules, njit)
+
+
+class NotPredicate(Predicate):
+    """Represents the inversion of a rule; the rule must be False"""
+
+    __slots__ = ()
+
+    def __init__(self, rule: TruthFinder):
+        self.rule = _unwrapped(rule)
+
+    def item_passes(self, item: t.Any) -> bool:
+        return not self.rule(item)
+
+    def __invert__(self) -> Predicate:
+        # inverting twice gives back the original rule, unless a subclass
+        # adds logic of its own that the inversion must keep
+        if type(self) is NotPredicate:
+            return Predicate(self.rule)
+        return NotPredicate(self)
+
+    def _batch_filtered(self, chunk: t.List) -> t.Iterable:
+        return filterfalse(self.rule, chunk)
+
+    def _array_mask(self, array: t.Any) -> t.Any:
+        return ~_rule_mask(self.rule, array)
+
+    def _jit_rule(self, njit: t.Callable) -> t.Callable:
+        return _jit_fused("not r0(item)", (self.rule,), njit)
+
+    def _source(self, namespace: t.Dict[str, t.Any]) -> str:
+        return f"(not {_inlined_source(self.rule, namespace)})"
 
 
 class PredicateDifference(Predicate):
@@ -97,11 +561,19 @@ class PredicateDifference(Predicate):
 
     For a given item to pass, a must return True, and b must
     return False
+
+    By default b is only evaluated when a passes. Passing
+    `short_circuit=False` always evaluates both rules, for when b must run
+    for every item; this is never faster, since b is called even when a
+    has already decided the result.
     """
 
-    def __init__(self, a: TruthFinder, b: TruthFinder):
-        self.rule_a = a
-        self.rule_b = b
+    __slots__ = ("rule_a", "rule_b", "short_circuit")
+
+    def __init__(self, a: TruthFinder, b: TruthFinder, short_circuit: bool = True):
+        self.rule_a = _unwrapped(a)
+        self.rule_b = _unwrapped(b)
+        self.short_circuit = short_circuit
 
     def item_passes(self, item: t.Any) -> bool:
         """The given item passes one rule but fails another.
@@ -111,7 +583,120 @@ class PredicateDifference(Predicate):
 
         Returns: bool
         """
-        return self.rule_a(item) and not self.rule_b(item)
+        if self.short_circuit:
+            return self.rule_a(item) and not self.rule_b(item)
+        return bool(self.rule_a(item)) & (not self.rule_b(item))
+
+    def _batch_filtered(self, chunk: t.List) -> t.Iterable:
+        return filterfalse(self.rule_b, compress(chunk, map(self.rule_a, chunk)))
+
+    def _array_mask(self, array: t.Any) -> t.Any:
+        return _rule_mask(self.rule_a, array) & ~_rule_mask(self.rule_b, array)
+
+    def _jit_rule(self, njit: t.Callable) -> t.Callable:
+        rules = (self.rule_a, self.rule_b)
+        return _jit_fused("r0(item) and not r1(item)", rules, njit)
+
+    def _source(self, namespace: t.Dict[str, t.Any]) -> str:
+        a = _inlined_source(self.rule_a, namespace)
+        b = _inlined_source(self.rule_b, namespace)
+        if self.short_circuit:
+            return f"({a} and not {b})"
+        return f"(bool({a}) & (not {b}))"
+
+
+_BUILTIN_TYPES = frozenset(
+    {
+        Predicate,
+        PredicateIntersection,
+        PredicateUnion,
+        ExclusivePredicateUnion,
+        NotPredicate,
+        PredicateDifference,
+    }
+)
+
+# exclusive unions stay opaque when compiled, to keep their short-circuiting
+_INLINED_TYPES = frozenset(
+    {
+        Predicate,
+        PredicateIntersection,
+        PredicateUnion,
+        NotPredicate,
+        PredicateDifference,
+    }
+)
+
+
+def _has_own_logic(predicate: Predicate) -> bool:
+    """The Predicate is of a subclass that changes how items are evaluated.
+
+    Such subclasses override `item_passes` or `__call__`, so shortcuts that
+    evaluate the rules of a built-in Predicate directly would skip their
+    logic; they must be called like any other rule instead.
+    """
+    for base in type(predicate).__mro__:
+        if base in _BUILTIN_TYPES:
+            return type(predicate).__call__ is not base.__call__
+    return True
+
+
+def _batch_filtered_items(
+    predicate: Predicate, iterable: t.Iterable, batch: int
+) -> t.Iterator:
+    """Yields the items of `iterable` that pass, evaluated `batch` at a time."""
+    # subclasses with their own logic must be called per item, rather
+    # than having their rules applied to the batch directly
+    if _has_own_logic(predicate):
+        batch_filtered = Predicate._batch_filtered
+    else:
+        batch_filtered = type(predicate)._batch_filtered
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, batch))
+        if not chunk:
+            return
+        yield from batch_filtered(predicate, chunk)
+
+
+def _adaptive_filtered(
+    composite: Predicate, iterable: t.Iterable, warmup: int, stop_on: bool
+) -> t.Iterator:
+    """Filters with `composite`, reordering its rules by observed pass rate.
+
+    For the first `warmup` items the rules are evaluated in their original
+    order, stopping at the first rule that returns `stop_on` just as the
+    composite would. The remaining items are filtered by a copy of the
+    composite with its rules sorted by the pass rate seen for each rule;
+    rules that were never reached keep their place at the end.
+    """
+    if _has_own_logic(composite):
+        yield from composite.filtered(iterable)
+        return
+    rules = composite.rules
+    pass_counts = [0] * len(rules)
+    call_counts = [0] * len(rules)
+    iterator = iter(iterable)
+    for item in islice(iterator, warmup):
+        passes = not stop_on
+        for index, rule in enumerate(rules):
+            result = bool(rule(item))
+            call_counts[index] += 1
+            pass_counts[index] += result
+            if result is stop_on:
+                passes = stop_on
+                break
+        if passes:
+            yield item
+
+    def pass_rate(index):
+        if not call_counts[index]:
+            return float(not stop_on)
+        return pass_counts[index] / call_counts[index]
+
+    order = sorted(range(len(rules)), key=pass_rate, reverse=stop_on)
+    tuned = type(composite)(*(rules[index] for index in order))
+    yield from tuned.filtered(iterator)
 
 
 def predicate(rule: TruthFinder) -> Predicate:
@@ -127,19 +712,32 @@ def predicate(rule: TruthFinder) -> Predicate:
 
 
 def predicate_factory(
-    func: t.Callable[[t.Any], TruthFinder]
+    func: t.Callable[[t.Any], TruthFinder],
 ) -> t.Callable[[t.Any], Predicate]:
     """Decorator to convert a function into a Predicate factory.
 
+    The 128 most recently produced Predicates are cached by their arguments,
+    so calling the factory again with the same hashable arguments returns
+    the same Predicate instead of building a new one. Calls with unhashable
+    arguments are never cached.
+
     Args:
         func (callable): a callable that returns another truth-finding callable
 
     Returns: Predicate-producing callable
     """
 
+    @lru_cache(maxsize=128, typed=True)
+    def cached(*args, **kwargs):
+        return Predicate(func(*args, **kwargs))
+
     @wraps(func)
     def wrapper(*args, **kwargs):
-        return Predicate(func(*args, **kwargs))
+        try:
+            hash((args, tuple(kwargs.values())))
+        except TypeError:
+            return Predicate(func(*args, **kwargs))
+        return cached(*args, **kwargs)
 
     return wrapper
 
@@ -150,4 +748,5 @@ Rule = Predicate
 All = PredicateIntersection
 Any = PredicateUnion
 OnlyOne = ExclusivePredicateUnion
+Not = NotPredicate
 ATrueBFalse = PredicateDifference
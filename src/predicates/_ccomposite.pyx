@@ -0,0 +1,43 @@
+# cython: language_level=3
+"""Compiled evaluators for long chains of rules in compound Predicates.
+
+This extension is optional and is not built with the package, which ships
+as pure Python. When it has been built in place, for example with
+
+    cythonize -i src/predicates/_ccomposite.pyx
+
+(which is what the `tests_compiled` nox session does),
+PredicateIntersection and PredicateUnion use it to evaluate chains that are
+too long for a generated lambda. Otherwise a pure Python loop is used.
+"""
+
+
+cdef class AllOf:
+    """Callable that is True if every rule passes the given item"""
+
+    cdef readonly tuple rules
+
+    def __init__(self, tuple rules):
+        self.rules = rules
+
+    def __call__(self, item):
+        for rule in self.rules:
+            if not rule(item):
+                return False
+        return True
+
+
+cdef class AnyOf:
+    """Callable that is True if any rule passes the given item"""
+
+    cdef readonly tuple rules
+
+    def __init__(self, tuple rules):
+        self.rules = rules
+
+    def __call__(self, item):
+        for rule in self.rules:
+            if rule(item):
+                return True
+        return False
+
@@ -1,3 +1,6 @@
+import copy
+import pickle
+
 import pytest
 import predicates
 
@@ -43,6 +46,113 @@ def assert_predicate_intersection(is_even_and_positive):
     assert is_even_and_positive(2)
 
 
+def test_chained_intersection_is_flat():
+    is_even = predicates.Predicate(lambda x: x % 2 == 0)
+    is_positive = predicates.Predicate(lambda x: x > 0)
+    is_small = predicates.Predicate(lambda x: x < 10)
+
+    chained = is_even & is_positive & is_small
+    assert chained.rules == (is_even.rule, is_positive.rule, is_small.rule)
+    assert chained(4)
+    assert not chained(12)
+
+    merged = (is_even & is_positive) & (is_small & is_even)
+    assert len(merged.rules) == 4
+
+    reflected = (lambda x: x % 3 == 0) & is_even
+    assert isinstance(reflected, predicates.PredicateIntersection)
+    assert reflected(6)
+    assert not reflected(4)
+
+
+def test_reflected_operators_require_callables():
+    is_even = predicates.Predicate(lambda x: x % 2 == 0)
+    with pytest.raises(TypeError):
+        {1} | is_even
+    with pytest.raises(TypeError):
+        {1} & is_even
+
+
+def test_long_chains_match_short_chains():
+    rules = [predicates.Predicate(lambda x, n=n: x % n != 0) for n in range(2, 14)]
+    long_intersection = predicates.All(*rules)
+    long_union = predicates.Any(*rules)
+    for n in range(200):
+        assert long_intersection(n) is all(rule(n) for rule in rules)
+        assert long_union(n) is any(rule(n) for rule in rules)
+        assert predicates.All(*rules[:3])(n) is all(rule(n) for rule in rules[:3])
+        assert predicates.Any(*rules[:3])(n) is any(rule(n) for rule in rules[:3])
+
+
+def test_compiled_chains():
+    ccomposite = pytest.importorskip("predicates._ccomposite")
+    rules = tuple(predicates.Predicate(lambda x, n=n: x % n != 0) for n in range(2, 5))
+    all_of = ccomposite.AllOf(rules)
+    any_of = ccomposite.AnyOf(rules)
+    for n in range(50):
+        assert all_of(n) is all(rule(n) for rule in rules)
+        assert any_of(n) is any(rule(n) for rule in rules)
+
+
+def test_long_chains_use_compiled_evaluator():
+    ccomposite = pytest.importorskip("predicates._ccomposite")
+    long_chain = [lambda x, n=n: x % n != 0 for n in range(2, 11)]
+    short_chain = long_chain[:8]
+    assert type(predicates.All(*long_chain)._fused) is ccomposite.AllOf
+    assert type(predicates.Any(*long_chain)._fused) is ccomposite.AnyOf
+    assert type(predicates.All(*short_chain)._fused) is not ccomposite.AllOf
+
+
+def test_assigning_rules_updates_evaluation():
+    is_even = predicates.Predicate(lambda x: x % 2 == 0)
+    is_positive = predicates.Predicate(lambda x: x > 0)
+
+    both = is_even & is_positive
+    both.rules = (is_even,)
+    assert both.rules == (is_even.rule,)
+    assert both(-2)
+
+    either = is_even | is_positive
+    either.rules = [is_positive, predicates.always_false]
+    assert either.rules == (is_positive.rule,)
+    assert not either(-2)
+
+
+def is_even(x):
+    return x % 2 == 0
+
+
+def is_positive(x):
+    return x > 0
+
+
+def test_composites_pickle_and_deepcopy():
+    for rule in (
+        predicates.All(is_even, is_positive),
+        predicates.Any(is_even, is_positive),
+        predicates.All(*[is_even] * 3, *[is_positive] * 7),
+    ):
+        restored = pickle.loads(pickle.dumps(rule))
+        assert type(restored) is type(rule)
+        assert restored.rules == rule.rules
+        for n in range(-4, 5):
+            assert restored(n) == rule(n)
+
+    class AtLeast:
+        def __init__(self, threshold):
+            self.threshold = threshold
+
+        def __call__(self, item):
+            return item >= self.threshold
+
+    original = predicates.All(AtLeast(5), is_even)
+    copied = copy.deepcopy(original)
+    copied.rules[0].threshold = 100
+    assert not copied.rules[0](50)
+    assert not copied(50)
+    assert original(50)
+
+
 def test_predicate_union():
     is_even = predicates.Predicate(lambda x: x % 2 == 0)
     is_negative = predicates.Predicate(lambda x: x < 0)
@@ -57,6 +167,22 @@ def assert_predicate_union(is_even_or_negative):
     assert not is_even_or_negative(3)
 
 
+def test_chained_union_is_flat():
+    is_even = predicates.Predicate(lambda x: x % 2 == 0)
+    is_negative = predicates.Predicate(lambda x: x < 0)
+    is_large = predicates.Predicate(lambda x: x > 100)
+
+    chained = is_even | is_negative | is_large
+    assert chained.rules == (is_even.rule, is_negative.rule, is_large.rule)
+    assert chained(101)
+    assert not chained(3)
+
+    reflected = (lambda x: x == 3) | is_even
+    assert isinstance(reflected, predicates.PredicateUnion)
+    assert reflected(3)
+    assert not reflected(5)
+
+
 def test_exclusive_predicate_union():
     is_positive = predicates.Predicate(lambda x: x > 0)
     is_multiple_of_3 = predicates.Predicate(lambda x: x % 3 == 0)
@@ -74,12 +200,31 @@ def assert_exclusive_predicate_union(is_positive_xor_multiple_of_3):
     assert not is_positive_xor_multiple_of_3(3)  # positive and multiple of 3
 
 
+def test_exclusive_predicate_union_short_circuits():
+    calls = []
+
+    def record(result):
+        def rule(_):
+            calls.append(result)
+            return result
+
+        return rule
+
+    rule = predicates.OnlyOne(record(True), record(True), record(False))
+    assert not rule(None)
+    assert calls == [True, True]
+    assert not predicates.OnlyOne(record(False), record(False))(None)
+
+
 def test_predicate_difference():
     is_even = predicates.Predicate(lambda x: x % 2 == 0)
     is_positive = predicates.Predicate(lambda x: x > 0)
     assert_predicate_difference(predicates.PredicateDifference(is_even, is_positive))
     assert_predicate_difference(is_even - is_positive)
     assert_predicate_difference(predicates.ATrueBFalse(a=is_even, b=is_positive))
+    assert_predicate_difference(
+        predicates.PredicateDifference(is_even, is_positive, short_circuit=False)
+    )
 
 
 def assert_predicate_difference(is_even_and_not_positive):
@@ -88,6 +233,355 @@ def assert_predicate_difference(is_even_and_not_positive):
     assert not is_even_and_not_positive(2)
 
 
+def test_filtered_chains_are_fused():
+    is_even = predicates.Predicate(lambda x: x % 2 == 0)
+    is_positive = predicates.Predicate(lambda x: x > 0)
+    is_small = predicates.Predicate(lambda x: x < 10)
+
+    chained = is_small.filtered(is_positive.filtered(is_even.filtered(range(-5, 15))))
+    fused_rule, _ = chained.__reduce__()[1]
+    assert fused_rule.rules == (is_even.rule, is_positive.rule, is_small.rule)
+    assert list(chained) == [2, 4, 6, 8]
+
+    plain = is_even.filtered(filter(None, [0, 1, 2, 3, 4]))
+    assert list(plain) == [2, 4]
+
+
+def test_filtered_adaptive_intersection():
+    calls = []
+
+    def rarely_false(x):
+        calls.append("rarely_false")
+        return x != 7
+
+    def often_false(x):
+        calls.append("often_false")
+        return x % 10 == 0
+
+    rule = predicates.PredicateIntersection(rarely_false, often_false)
+    numbers = range(100)
+    result = list(rule.filtered_adaptive(numbers, warmup=10))
+    assert result == list(rule.filtered(numbers))
+
+    del calls[:]
+    list(rule.filtered_adaptive(numbers, warmup=10))
+    # after warmup, the other rule only runs when the selective one passes
+    assert calls[19:].count("rarely_false") == 9
+
+
+def test_filtered_adaptive_keeps_short_circuit_during_warmup():
+    is_int = predicates.Predicate(lambda x: isinstance(x, int))
+    is_even = predicates.Predicate(lambda x: x % 2 == 0)
+    items = [1, 2, 3, "a", 4]
+    rule = is_int & is_even
+    assert list(rule.filtered_adaptive(items)) == [2, 4]
+
+
+def test_filtered_adaptive_subclass():
+    class PositiveAll(predicates.PredicateIntersection):
+        def item_passes(self, item):
+            return item > 0 and super().item_passes(item)
+
+    rule = PositiveAll(lambda x: x % 2 == 0)
+    numbers = range(-4, 5)
+    assert list(rule.filtered_adaptive(numbers, warmup=3)) == [2, 4]
+
+
+def test_filtered_adaptive_union():
+    is_rare = predicates.Predicate(lambda x: x == 3)
+    is_common = predicates.Predicate(lambda x: x % 3 != 0)
+    rule = is_rare | is_common
+    numbers = range(50)
+    assert list(rule.filtered_adaptive(numbers, warmup=5)) == list(
+        rule.filtered(numbers)
+    )
+
+
+def test_filtered_adaptive_simple_predicate():
+    is_even = predicates.Predicate(lambda x: x % 2 == 0)
+    assert list(is_even.filtered_adaptive(range(6))) == [0, 2, 4]
+
+
+def test_filtered_batch():
+    is_even = predicates.Predicate(lambda x: x % 2 == 0)
+    is_positive = predicates.Predicate(lambda x: x > 0)
+    is_small = predicates.Predicate(lambda x: x < 5)
+    numbers = range(-20, 21)
+
+    for rule in (
+        is_even,
+        is_even & is_positive & is_small,
+        is_even | is_positive,
+        predicates.OnlyOne(is_even, is_positive, is_small),
+        is_even - is_positive,
+        ~is_even,
+    ):
+        expected = list(rule.filtered(numbers))
+        assert list(rule.filtered_batch(numbers)) == expected
+        assert list(rule.filtered_batch(numbers, batch=3)) == expected
+
+    assert list(is_even.filtered_batch([])) == []
+
+    for batch in (0, -1):
+        with pytest.raises(ValueError):
+            is_even.filtered_batch(numbers, batch=batch)
+
+
+def test_filtered_batch_subclass():
+    class PositiveAll(predicates.PredicateIntersection):
+        def item_passes(self, item):
+            return item > 0 and super().item_passes(item)
+
+    class PositiveNot(predicates.NotPredicate):
+        def item_passes(self, item):
+            return item > 0 and super().item_passes(item)
+
+    is_even = lambda x: x % 2 == 0
+    numbers = range(-4, 5)
+    assert list(PositiveAll(is_even).filtered_batch(numbers)) == [2, 4]
+    assert list(PositiveNot(is_even).filtered_batch(numbers)) == [1, 3]
+
+
+def test_invert_not_predicate_subclass():
+    class PositiveNot(predicates.NotPredicate):
+        def item_passes(self, item):
+            return item > 0 and super().item_passes(item)
+
+    inverted = ~PositiveNot(lambda x: x % 2 == 0)
+    assert isinstance(inverted, predicates.NotPredicate)
+    assert inverted(-3)
+    assert inverted(2)
+    assert not inverted(3)
+
+
+def test_filtered_array():
+    np = pytest.importorskip("numpy")
+    is_even = predicates.Predicate(lambda x: x % 2 == 0)
+    is_positive = predicates.Predicate(lambda x: x > 0)
+    is_small = predicates.Predicate(lambda x: x < 5)
+    numbers = np.arange(-6, 7)
+
+    def expected(rule):
+        return [n for n in numbers.tolist() if rule(n)]
+
+    for rule in (
+        is_even,
+        is_even & is_positive,
+        is_even | is_positive,
+        predicates.OnlyOne(is_even, is_positive, is_small),
+        is_even - is_positive,
+        ~is_even,
+        predicates.All(is_even, predicates.always_true),
+    ):
+        assert rule.filtered_array(numbers).tolist() == expected(rule)
+
+    assert is_even.filtered_array([1, 2, 3, 4]).tolist() == [2, 4]
+
+
+def test_filtered_array_subclass():
+    np = pytest.importorskip("numpy")
+
+    class Positive(predicates.Predicate):
+        def item_passes(self, item):
+            return self.rule(item) and item > 0
+
+    class PositiveAll(predicates.PredicateIntersection):
+        def item_passes(self, item):
+            return item > 0 and super().item_passes(item)
+
+    is_even = lambda x: x % 2 == 0
+    numbers = np.arange(-4, 5)
+    assert Positive(is_even).filtered_array(numbers).tolist() == [2, 4]
+    assert PositiveAll(is_even).filtered_array(numbers).tolist() == [2, 4]
+    nested = predicates.All(Positive(is_even), lambda x: x < 4)
+    assert nested.filtered_array(numbers).tolist() == [2]
+
+
+def test_jit():
+    pytest.importorskip("numba")
+    is_even = predicates.Predicate(lambda x: x % 2 == 0)
+    is_positive = predicates.Predicate(lambda x: x > 0)
+    is_small = predicates.Predicate(lambda x: x < 5)
+
+    for rule in (
+        is_even,
+        is_even & is_positive,
+        is_even | is_positive,
+        predicates.OnlyOne(is_even, is_positive, is_small),
+        is_even - is_positive,
+        ~is_even,
+        (is_even & is_positive) | (~is_small & is_even),
+    ):
+        compiled = rule.jit()
+        assert isinstance(compiled, predicates.Predicate)
+        for n in range(-6, 7):
+            assert compiled(n) == rule(n)
+
+
+def test_compile():
+    is_even = predicates.Predicate(lambda x: x % 2 == 0)
+    is_positive = predicates.Predicate(lambda x: x > 0)
+    is_small = predicates.Predicate(lambda x: x < 5)
+
+    class IsOdd(predicates.Predicate):
+        def item_passes(self, item):
+            return item % 2 == 1
+
+    for rule in (
+        is_even,
+        (is_even & is_positive) | (~is_small & is_even),
+        predicates.OnlyOne(is_even, is_positive, is_small) & ~is_even,
+        is_even - (is_positive | is_small),
+        predicates.PredicateDifference(is_even, is_small, short_circuit=False),
+        IsOdd(None) | is_small,
+        predicates.Predicate(is_even & is_positive),
+    ):
+        compiled = rule.compile()
+        assert type(compiled) is predicates.Predicate
+        for n in range(-8, 9):
+            assert compiled(n) == bool(rule(n))
+
+    deep = is_even
+    for _ in range(1000):
+        deep = deep - is_small
+    assert deep.compile() is deep
+
+
+def test_jit_rejects_subclasses_with_own_logic():
+    pytest.importorskip("numba")
+
+    class Positive(predicates.Predicate):
+        def item_passes(self, item):
+            return self.rule(item) and item > 0
+
+    is_even = lambda x: x % 2 == 0
+    with pytest.raises(TypeError):
+        Positive(is_even).jit()
+    with pytest.raises(TypeError):
+        (Positive(is_even) | predicates.Predicate(is_even)).jit()
+
+
+def test_memoized():
+    calls = []
+
+    def is_even(x):
+        calls.append(x)
+        return x % 2 == 0
+
+    rule = (predicates.Predicate(is_even) & (lambda x: x > 0)).memoized()
+    assert isinstance(rule, predicates.Predicate)
+    assert rule(2)
+    assert rule(2)
+    assert not rule(3)
+    assert calls == [2, 3]
+
+
+def test_memoized_keeps_equal_items_of_different_types_apart():
+    is_int = predicates.Predicate(lambda x: type(x) is int).memoized()
+    assert is_int(1)
+    assert not is_int(True)
+    assert not is_int(1.0)
+
+
+def test_memoized_errors_are_not_chained():
+    rule = predicates.Predicate(lambda x: 1 / len(x)).memoized()
+    for empty in ("", []):
+        with pytest.raises(ZeroDivisionError) as error:
+            rule(empty)
+        assert error.value.__context__ is None
+
+
+def test_memoized_unhashable_items():
+    calls = []
+
+    def is_empty(x):
+        calls.append(x)
+        return not x
+
+    rule = predicates.Predicate(is_empty).memoized()
+    empty, full = [], [1]
+    assert rule(empty)
+    assert rule(empty)
+    assert not rule(full)
+    assert not rule(full)
+    assert len(calls) == 2
+
+
+def test_predicate_difference_short_circuit():
+    calls = []
+
+    def is_positive(x):
+        calls.append(x)
+        return x > 0
+
+    is_even = lambda x: x % 2 == 0
+    assert not predicates.PredicateDifference(is_even, is_positive)(1)
+    assert calls == []
+    assert not predicates.PredicateDifference(is_even, is_positive, False)(1)
+    assert calls == [1]
+
+
+def test_predicates_have_no_instance_dict():
+    is_even = predicates.Predicate(lambda x: x % 2 == 0)
+    for rule in (
+        is_even,
+        is_even & is_even,
+        is_even | is_even,
+        is_even ^ is_even,
+        is_even - is_even,
+        ~is_even,
+    ):
+        assert not hasattr(rule, "__dict__")
+
+
+def test_call_is_item_passes():
+    class IsEven(predicates.Predicate):
+        def item_passes(self, item):
+            return item % 2 == 0
+
+    for cls in (
+        predicates.Predicate,
+        predicates.PredicateIntersection,
+        predicates.PredicateUnion,
+        predicates.ExclusivePredicateUnion,
+        predicates.PredicateDifference,
+        predicates.NotPredicate,
+        IsEven,
+    ):
+        assert cls.__call__ is cls.item_passes
+    assert IsEven(None)(2)
+    assert not IsEven(None)(3)
+
+
+def test_subclass_with_custom_call_is_kept():
+    calls = []
+
+    class Logged(predicates.Predicate):
+        def __call__(self, item):
+            calls.append(item)
+            return self.item_passes(item)
+
+    class Positive(Logged):
+        def item_passes(self, item):
+            return item > 0
+
+    assert Positive(None)(3)
+    assert not Positive(None)(-3)
+    assert calls == [3, -3]
+
+
+def test_subclass_with_mixin_item_passes():
+    class PositiveMixin:
+        def item_passes(self, item):
+            return item > 0
+
+    class Positive(PositiveMixin, predicates.Predicate):
+        pass
+
+    assert Positive(None)(3)
+    assert not Positive(None)(-3)
+
+
 def test_predicate_decorator():
     @predicates.predicate
     def is_even(x):
@@ -112,13 +606,74 @@ def test_predicate_factory_decorator():
     assert not greater_than_5(4)
 
 
+def test_constant_rules_are_simplified():
+    is_even = predicates.Predicate(lambda x: x % 2 == 0)
+    always_true = predicates.always_true
+    always_false = predicates.always_false
+
+    assert predicates.All(always_true, is_even, always_true).rules == (is_even.rule,)
+    assert predicates.All(is_even, always_false).rules == (always_false,)
+    assert predicates.All(always_true).rules == (always_true,)
+    assert predicates.Any(always_false, is_even).rules == (is_even.rule,)
+    assert predicates.Any(is_even, always_true).rules == (always_true,)
+    assert predicates.Any(always_false).rules == (always_false,)
+
+    assert (~predicates.Predicate(always_true)).rule is always_false
+    assert (~predicates.Predicate(always_false)).rule is always_true
+
+
+def test_plain_predicates_are_unwrapped():
+    is_even = predicates.Predicate(lambda x: x % 2 == 0)
+    is_positive = predicates.Predicate(lambda x: x > 0)
+    either = is_even | is_positive
+
+    both = predicates.All(is_even, either)
+    assert both.rules == (is_even.rule, either)
+    assert predicates.OnlyOne(is_even, either).rules == (is_even.rule, either)
+    difference = is_even - either
+    assert difference.rule_a is is_even.rule
+    assert difference.rule_b is either
+    assert predicates.All(predicates.Predicate(predicates.always_false)).rules == (
+        predicates.always_false,
+    )
+
+
+def test_predicate_factory_caches_by_arguments():
+    calls = []
+
+    @predicates.predicate_factory
+    def one_of(values):
+        calls.append(values)
+        return lambda x: x in values
+
+    assert one_of((1, 2)) is one_of((1, 2))
+    assert one_of(values=(1, 2)) is one_of(values=(1, 2))
+    assert one_of((1, 2)) is not one_of((3,))
+
+    unhashable = one_of([1, 2])
+    assert unhashable(1)
+    assert one_of([1, 2]) is not unhashable
+    assert calls == [(1, 2), (1, 2), (3,), [1, 2], [1, 2]]
+
+
 def test_predicate_invert_magic_method():
     is_even = predicates.Predicate(lambda x: x % 2 == 0)
 
     is_not_even = ~is_even
-    assert isinstance(is_not_even, predicates.PredicateDifference)
+    assert isinstance(is_not_even, predicates.NotPredicate)
     assert is_not_even(1)
     assert not is_not_even(2)
+    assert is_not_even.rule is is_even.rule
+
+    is_even_again = ~is_not_even
+    assert is_even_again(2)
+    assert not is_even_again(1)
+
+    either = is_even | predicates.Predicate(lambda x: x > 0)
+    neither = predicates.Not(either)
+    assert neither.rule is either
+    assert neither(-1)
+    assert not neither(2)
 
 
 if __name__ == "__main__":